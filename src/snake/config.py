@@ -5,13 +5,14 @@ from snake.constants import SpriteAttributes, TextAttributes
 
 
 # pylint: disable=too-many-instance-attributes
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configure game defaults."""
 
     # Game speed.
     initial_update_delay: int = 50  # milliseconds
-    move_delta: float = 10.0  # Distance to move snake head per step.
+    move_delta: int = 10  # Distance to move snake head per step.
+    frames_per_redraw: int = 1  # Game steps between screen redraws.
 
     # Scoreboard.
     scoreboard_height: int = 50
@@ -40,7 +41,7 @@ class Config:
         return self.background_color
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpriteConfig:
     """Game Turtle attributes."""
     head: SpriteAttributes = SpriteAttributes(color='limegreen',
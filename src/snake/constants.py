@@ -1,7 +1,7 @@
 """Type definitions, Enums and other constants."""
 
 from typing import NamedTuple
-from enum import Enum, auto
+from enum import IntEnum
 
 
 class SpriteAttributes(NamedTuple):
@@ -21,36 +21,32 @@ class TextAttributes(NamedTuple):
 # noinspection SpellCheckingInspection
 class Coords(NamedTuple):
     """x/y coordinates."""
-    x: float
-    y: float
+    x: int
+    y: int
 
 
-# Global dictionary for opposite directions
-_BACKTRACK_MAP = {
-    'UP': 'DOWN',
-    'DOWN': 'UP',
-    'LEFT': 'RIGHT',
-    'RIGHT': 'LEFT',
-}
+class Direction(IntEnum):
+    """Snake direction flags.
 
-
-class Direction(Enum):
-    """Snake direction flags."""
-    UP = auto()
-    DOWN = auto()
-    LEFT = auto()
-    RIGHT = auto()
-    STOP = auto()
+    Opposite directions are encoded as pairs that differ only in
+    the lowest bit.
+    """
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+    STOP = 4
 
     def is_opposite(self, d: 'Direction') -> bool:
         """Return True if d is opposite direction."""
-        return self.name == _BACKTRACK_MAP.get(d.name)
+        return self ^ d == 1
 
 
-KEY_BINDINGS: dict[Direction, str] = {
-    Direction.UP: "Up",
-    Direction.DOWN: "Down",
-    Direction.LEFT: "Left",
-    Direction.RIGHT: "Right",
-    Direction.STOP: "space"
-}
+# Key names, indexed by Direction value.
+KEY_BINDINGS: tuple[str, ...] = (
+    "Up",  # Direction.UP
+    "Down",  # Direction.DOWN
+    "Left",  # Direction.LEFT
+    "Right",  # Direction.RIGHT
+    "space",  # Direction.STOP
+)
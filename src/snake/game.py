@@ -1,7 +1,9 @@
 """Python / Turtle implementation of classic Snake game."""
 
+import time
 import turtle
-from typing import Callable
+from functools import partial
+from itertools import islice
 
 from snake.config import Config, SpriteConfig
 from snake.constants import Direction, KEY_BINDINGS
@@ -11,6 +13,15 @@ from snake.ui import ScreenManager
 
 class SnakeGame:
     """Snake game."""
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = ('config', 'sprite_config', '_food_distance_sq',
+                 '_half_head_size', '_grid_collision', '_x_min', '_x_max',
+                 '_y_min', '_y_max', '_frames_per_redraw',
+                 '_frames_since_redraw', 'screen_manager', 'game_state',
+                 '_move_snake', '_draw_tail', '_redraw', '_ontimer',
+                 '_next_tick', '_dirty', '_update')
+    # Most missed steps to run in one update before giving up on them.
+    _max_steps_per_update = 5
 
     def __init__(self, config: Config, sprite_config: SpriteConfig) -> None:
         """Initialise SnakeGame.
@@ -22,62 +33,90 @@ class SnakeGame:
         self.config = config
         self.sprite_config = sprite_config
 
+        # Per-frame constants.
+        self._food_distance_sq = sprite_config.sprite_size ** 2
+        self._half_head_size = sprite_config.sprite_size // 2
+        # When segments are at least half a head apart, they can only
+        # touch the head by sharing its exact position.
+        self._grid_collision = config.move_delta >= self._half_head_size
+        self._set_collision_bounds()
+        self._frames_per_redraw = max(1, config.frames_per_redraw)
+        self._frames_since_redraw = 0
+        # True when sprites have changed since the last redraw.
+        self._dirty = True
+
         self.screen_manager = ScreenManager(config, sprite_config)
         self.game_state = GameState(config, sprite_config)
         self.setup_listeners()
 
+        # Bound methods called on every frame.
+        self._move_snake = self.game_state.snake.move
+        self._draw_tail = self.game_state.snake.draw_tail
+        self._redraw = turtle.update  # pylint: disable=no-member
+        self._ontimer = self.screen_manager.screen.ontimer
+        self._update = self.update
+
         # A little flourish before we start.
         self.game_state.snake.spin_head()
         self.game_state.add_food_item()
 
         # Handle updates.
         self.screen_manager.update_score(self.game_state)
+        self._next_tick = time.perf_counter()
         self.update()
 
     def setup_listeners(self) -> None:
         """Configure listeners."""
         self.screen_manager.screen.listen()
 
-        for direction, char in KEY_BINDINGS.items():
-            fun: Callable = (
-                lambda d=direction: self.game_state.snake.set_direction(d)
-            )
-            self.screen_manager.screen.onkeypress(fun, char)
+        set_direction = self.game_state.snake.set_direction
+        for direction in Direction:
+            self.screen_manager.screen.onkeypress(
+                partial(set_direction, direction), KEY_BINDINGS[direction])
+
+    def _set_collision_bounds(self) -> None:
+        """Calculate the limits of head movement within the board."""
+        half_head_size = self._half_head_size
+        half_width = self.config.display_width // 2
+        half_height = self.config.display_height // 2
+
+        self._x_min = -(half_width - half_head_size)  # Left
+        self._x_max = -self._x_min
+        self._y_min = -(half_height - half_head_size)  # Bottom
+        self._y_max = -self._y_min - self.config.scoreboard_height
 
     def check_collision(self) -> bool:
         """Return True if snake collides with edge of board or its tail."""
         return self.edge_collision() or self.tail_collision()
 
     def tail_collision(self) -> bool:
-        """Return True if head collides with edge of board."""
-        head = self.game_state.head
-        half_head_size = self.sprite_config.sprite_size // 2
+        """Return True if head collides with its tail."""
+        if self._grid_collision:
+            return self.game_state.snake.occupies(self.game_state.head_position)
+        head_x, head_y = self.game_state.head_position
+        min_distance_sq = self._half_head_size ** 2
         # Ignore first segment which will be closer to head.
-        for segment in self.game_state.segments[1:]:
-            if segment.distance(head) < half_head_size:
+        for x_coord, y_coord in islice(self.game_state.segment_positions,
+                                       1, None):
+            if ((x_coord - head_x) ** 2 + (y_coord - head_y) ** 2
+                    < min_distance_sq):
                 return True
         return False
 
     def edge_collision(self) -> bool:
         """Return True if head collides with edge of board."""
         x_coord, y_coord = self.game_state.head_position
-        half_head_size = self.sprite_config.sprite_size // 2
-        half_width = self.config.display_width // 2
-        half_height = self.config.display_height // 2
-
-        x_min = -(half_width - half_head_size)  # Left
-        x_max = -x_min
-        y_min = -(half_height - half_head_size)  # Bottom
-        y_max = -y_min - self.config.scoreboard_height
-
-        return not (x_min <= x_coord <= x_max and
-                    y_min <= y_coord <= y_max)
+        return not (self._x_min <= x_coord <= self._x_max and
+                    self._y_min <= y_coord <= self._y_max)
 
     def check_food_collision(self):
         """Return True if head collides with food_attributes sprite."""
-        if self.game_state.food is not None:
-            return (self.game_state.head.distance(self.game_state.food)
-                    < self.sprite_config.sprite_size)
+        food = self.game_state.food
+        if food is not None:
+            head_x, head_y = self.game_state.head_position
+            food_x, food_y = food.position()
+            return ((head_x - food_x) ** 2 + (head_y - food_y) ** 2
+                    < self._food_distance_sq)
         return False
 
     def eat_food(self):
@@ -88,19 +127,58 @@ class SnakeGame:
         self.screen_manager.score_splash(self.game_state.food.value)
         if self.game_state.delay > 2:
             self.game_state.delay -= 1
-        print(self.game_state.delay)
         self.game_state.food.replace_food()
 
     def update(self) -> None:
-        """Main game loop to keep updating the game state."""
-        self.game_state.snake.move()
+        """Main game loop to keep updating the game state.
+
+        The game advances in fixed steps of game_state.delay. If the
+        timer fires late, the missed steps are run before redrawing,
+        up to a limit, so that game speed does not depend on how long
+        each frame takes to draw.
+        """
+        now = time.perf_counter()
+        game_state = self.game_state
+        step = self.step
+        max_steps = self._max_steps_per_update
+        next_tick = self._next_tick
+        steps = 0
+        while now >= next_tick and steps < max_steps:
+            step()
+            next_tick += game_state.delay / 1000
+            steps += 1
+        # Too far behind to catch up, so carry on from now.
+        self._next_tick = max(next_tick, now)
+
+        if (self._dirty
+                and self._frames_since_redraw >= self._frames_per_redraw):
+            self._frames_since_redraw = 0
+            self._dirty = False
+            self._draw_tail()
+            self._redraw()
+        self.schedule_update()
+
+    def step(self) -> None:
+        """Advance the game state by one move.
+
+        Nothing can change while the snake is stopped.
+        """
+        if not self._move_snake():
+            if self._dirty:
+                # No more steps are coming, so draw any still waiting.
+                self._frames_since_redraw = self._frames_per_redraw
+            return
+        self._dirty = True
+        self._frames_since_redraw += 1
         if self.check_collision():
             self.end_game()
         if self.check_food_collision():
             self.eat_food()
-        turtle.update()  # pylint: disable=no-member
-        screen = self.screen_manager.screen
-        screen.ontimer(self.update, self.game_state.delay)
+
+    def schedule_update(self) -> None:
+        """Schedule the next update for when the next step is due."""
+        delay = round((self._next_tick - time.perf_counter()) * 1000)
+        self._ontimer(self._update, max(1, delay))
 
     def end_game(self):
         """Handle game end."""
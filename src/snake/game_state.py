@@ -1,12 +1,12 @@
 """Game state classes."""
-import turtle
+from collections import deque
 from dataclasses import dataclass
 
 from snake.constants import Coords
 from snake.sprites import Food, Snake, SnakeHead
 
 
-@dataclass
+@dataclass(slots=True)
 class _Scores:
     """Game score state."""
     current: int = 0
@@ -15,6 +15,9 @@ class _Scores:
 
 class GameState:
     """Current game state."""
+    __slots__ = ('_scores', '_snake', '_sprite_size', 'delay', 'config',
+                 'sprite_config', '_food')
+
     def __init__(self, config, sprite_config):
         """Initialise GameState.
 
@@ -62,21 +65,33 @@ class GameState:
     @property
     def head_position(self) -> Coords:
         """Return x/y coordinates of snake head."""
-        return Coords(x=self._snake.head.xcor(), y=self._snake.head.ycor())
+        return self._snake.head_position
 
     @property
-    def segments(self) -> list[turtle.Turtle]:
-        """Return snake segments."""
+    def segments(self) -> list[int]:
+        """Return canvas item ids of snake segments."""
         return self._snake.segments
 
+    @property
+    def segment_positions(self) -> deque[tuple[int, int]]:
+        """Return x/y coordinates of snake segments."""
+        return self._snake.segment_positions
+
     @property
     def food(self) -> Food:
         """Return food sprite."""
         return self._food
 
     def add_food_item(self) -> None:
-        """Add a random food  item to the board."""
-        self._food = Food(self.config, self.sprite_config)
+        """Add a random food  item to the board.
+
+        The food sprite is created once, then reused for each new game.
+        """
+        if self._food is None:
+            self._food = Food(self.config, self.sprite_config, self._snake)
+        else:
+            self._food.replace_food()
+            self._food.showturtle()
 
     @property
     def sprite_size(self) -> int:
@@ -1,27 +1,36 @@
 """Custom Turtle game sprites."""
 import os
 import turtle
+from collections import Counter, deque
 from contextlib import contextmanager
-from itertools import pairwise
 from importlib import resources
 from pathlib import Path
 from random import choice, randint
-from typing import Any
+from typing import Any, Iterator
 
 from snake.config import Config, SpriteConfig
-from snake.constants import Direction, SpriteAttributes
+from snake.constants import Coords, Direction, SpriteAttributes
 
 
 class SnakeHead(turtle.Turtle):
     """Compound shape turtle for snake head."""
+    # Turtle shapes are registered globally, so only needs doing once.
+    _shape_registered = False
+    _spin_interval = 15  # milliseconds between spin animation steps.
+
     def __init__(self):
         """Initialise SnakeHead compound Turtle."""
         super().__init__()
         self.shape_name = 'head'
-        self.register_head_shape()
+        if not SnakeHead._shape_registered:
+            self.register_head_shape()
+            SnakeHead._shape_registered = True
         self.shape(self.shape_name)
         self.setheading(90)  # Up
         self.penup()
+        # Headings still to show in the current spin animation.
+        self._spin_headings: Iterator[int] = iter(())
+        self._spinning = False
 
     def register_head_shape(self):
         """Register compound shape for head of the snake."""
@@ -67,23 +76,61 @@ class SnakeHead(turtle.Turtle):
         return t.get_poly(), color
 
     def spin_head(self) -> None:
-        """Spin the head in its current position."""
-        turtle.tracer(1)  # pylint: disable=no-member
-        for i in range(90, -280, -10):
-            self.setheading(i)
-        turtle.tracer(0)  # pylint: disable=no-member
+        """Spin the head in its current position.
+
+        The spin is animated on a timer, so the game is not blocked
+        while it runs. Calling again during a spin restarts it.
+        """
+        self._spin_headings = iter(range(90, -280, -10))
+        if not self._spinning:
+            self._spinning = True
+            self._spin_step()
+
+    def stop_spin(self) -> None:
+        """End any spin animation at its next step."""
+        self._spin_headings = iter(())
+
+    def _spin_step(self) -> None:
+        """Show the next heading of the spin animation.
+
+        Note:
+            This is the only per-frame redraw outside SnakeGame.update().
+            The spin runs faster than the game step, and while the snake
+            is stopped the game loop has nothing to redraw.
+        """
+        heading = next(self._spin_headings, None)
+        if heading is None:
+            self._spinning = False
+            return
+        self.setheading(heading)
+        turtle.update()  # pylint: disable=no-member
+        self.screen.ontimer(self._spin_step, self._spin_interval)
 
 
 class Snake:
     """Snake character as compound turtle."""
-    _move_delta_map: dict[Direction, tuple[float, float]] = {}
-    _angle_map: dict[Direction, float] = {}
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = ('config', 'sprite_config', '_delta_table', 'head',
+                 'head_position', 'head_direction', '_delta', '_canvas',
+                 '_segment_radius', 'segments', '_spare_segments',
+                 '_positions', '_occupied')
+    # Head orientation in degrees, indexed by Direction.
+    # There is no angle associated with STOP.
+    _headings: tuple[int | None, ...] = (
+        90,  # UP
+        270,  # DOWN
+        180,  # LEFT
+        0,  # RIGHT
+        None,  # STOP
+    )
 
     def __init__(self, config: Config, sprite_config: SpriteConfig) -> None:
         """Initialise Snake.
 
         Snake consists of a compound turtle for the head, with a
-        list of 'segment' Turtles for the tail.
+        list of 'segment' canvas items for the tail. Drawing the tail
+        directly on the canvas avoids turtle redrawing every segment
+        on each screen update.
 
         Args:
             config: Default configuration settings.
@@ -92,52 +139,69 @@ class Snake:
         self.config = config
         self.sprite_config = sprite_config
 
-        # Map direction of movement to x,y delta.
-        if not Snake._move_delta_map:
-            Snake.set_move_delta_map(config.move_delta)
-        # Map direction of movement to orientation in degrees
-        if not Snake._angle_map:
-            Snake.set_angle_map()
+        # x,y delta for each direction of movement, indexed by Direction.
+        delta = config.move_delta
+        self._delta_table: tuple[tuple[int, int], ...] = (
+            (0, delta),  # UP
+            (0, -delta),  # DOWN
+            (-delta, 0),  # LEFT
+            (delta, 0),  # RIGHT
+            (0, 0),  # STOP
+        )
 
         self.head: SnakeHead = SnakeHead()
         self.head.penup()
+        # Authoritative head position, so it need not be read back
+        # from the turtle.
+        self.head_position = Coords(0, 0)
         self.head_direction = Direction.STOP
-        self.segments: list[turtle.Turtle] = []
+        # Move delta for current direction, cached by set_direction().
+        self._delta: tuple[int, int] = (0, 0)
+        self._canvas = self.head.getscreen().getcanvas()
+        self._segment_radius = sprite_config.sprite_size // 2
+        # Canvas item ids of the tail segments.
+        self.segments: list[int] = []
+        # Hidden segments from previous games, for reuse by add_segment().
+        # The next segment to use is at the end, so that each item
+        # always returns to the same place in the tail, keeping its color.
+        self._spare_segments: list[int] = []
+        # Segment coordinates, kept in step with self.segments.
+        self._positions: deque[tuple[int, int]] = deque()
+        # Number of segments at each position, for O(1) collision tests.
+        # The first segment is left out as it is always next to the head.
+        self._occupied: Counter[tuple[int, int]] = Counter()
         self.reset_snake()
 
     def reset_snake(self):
         """Reset snake and tail to initial state."""
-        self.head.goto(0, 0)
+        self.head_position = Coords(0, 0)
+        self.head.goto(self.head_position)
         self.head_direction = Direction.STOP
+        self._delta = (0, 0)
         for segment in self.segments:
-            segment.hideturtle()
+            self._canvas.itemconfigure(segment, state='hidden')
+        self._spare_segments.extend(reversed(self.segments))
         self.segments = []
-
-    @classmethod
-    def set_move_delta_map(cls, delta: float) -> None:
-        """Initialize or update the class-level movement delta map.
-
-        Maps the direction of movement to x,y delta.
-        """
-        cls._move_delta_map = {
-            Direction.UP: (0, delta),
-            Direction.DOWN: (0, -delta),
-            Direction.LEFT: (-delta, 0),
-            Direction.RIGHT: (delta, 0)
-        }
-
-    @classmethod
-    def set_angle_map(cls):
-        """Initialise angle map.
-
-        There is no angle associated with STOP.
-        """
-        cls._angle_map = {
-            Direction.RIGHT: 0,
-            Direction.UP: 90,
-            Direction.LEFT: 180,
-            Direction.DOWN: 270
-        }
+        self._positions = deque()
+        self._occupied = Counter()
+
+    @property
+    def segment_positions(self) -> deque[tuple[int, int]]:
+        """Return x/y coordinates of tail segments, nearest head first."""
+        return self._positions
+
+    def is_near(self, position: tuple[int, int], distance: int) -> bool:
+        """Return True if head or any segment is within distance of position."""
+        x_coord, y_coord = position
+        distance_sq = distance ** 2
+        for seg_x, seg_y in (self.head_position, *self._positions):
+            if (seg_x - x_coord) ** 2 + (seg_y - y_coord) ** 2 < distance_sq:
+                return True
+        return False
+
+    def occupies(self, position: tuple[int, int]) -> bool:
+        """Return True if any segment after the first is at position."""
+        return position in self._occupied
 
     def set_direction(self, direction: Direction) -> None:
         """Set snake head direction.
@@ -146,8 +210,11 @@ class Snake:
         """
         if not direction.is_opposite(self.head_direction):
             self.head_direction = direction
-            if direction in Snake._angle_map:
-                self.head.setheading(Snake._angle_map[direction])
+            self._delta = self._delta_table[direction]
+            heading = Snake._headings[direction]
+            if heading is not None:
+                self.head.stop_spin()
+                self.head.setheading(heading)
 
     def spin_head(self) -> None:
         """Spin the head in its current position."""
@@ -160,52 +227,98 @@ class Snake:
         position as the final segment, or the same position as the
         head if this is the first segment. The position will be corrected
         on the next move() call.
+
+        Segments hidden by reset_snake() are reused before creating
+        new ones.
         """
-        new_segment = turtle.Turtle()
-        new_segment.speed(0)
-        new_segment.shape("circle")
-        if len(self.segments) % 2 == 0:
-            new_segment.color(self.sprite_config.segment.color)
+        if self._spare_segments:
+            new_segment = self._spare_segments.pop()
+            self._canvas.itemconfigure(new_segment, state='normal')
         else:
-            new_segment.color(self.sprite_config.segment_alternate_color)
-        new_segment.penup()
+            new_segment = self._create_segment()
 
-        if self.segments:
+        if self._positions:
             # Add new segment at same position as final tail segment.
-            new_segment.goto(self.segments[-1].xcor(),
-                             self.segments[-1].ycor())
+            position = self._positions[-1]
         else:
             # Add new segment at head position.
-            new_segment.goto(self.head.xcor(), self.head.ycor())
+            position = self.head_position
 
+        position = tuple(position)
+        self._draw_segment(new_segment, position)
+        if self._positions:
+            self._occupied[position] += 1
         self.segments.append(new_segment)
+        self._positions.append(position)
+
+    def _create_segment(self) -> int:
+        """Return a new segment item, colored for the end of the tail."""
+        if len(self.segments) % 2 == 0:
+            color = self.sprite_config.segment.color
+        else:
+            color = self.sprite_config.segment_alternate_color
+        return self._canvas.create_oval(0, 0, 0, 0, fill=color, outline=color)
 
-    def move(self) -> None:
-        """Update snake position."""
+    def _draw_segment(self, segment: int, position: tuple[int, int]) -> None:
+        """Move segment canvas item to position.
+
+        Canvas y coordinates increase downwards, so are the negative
+        of turtle y coordinates.
+        """
+        x_coord, y_coord = position
+        radius = self._segment_radius
+        self._canvas.coords(segment,
+                            x_coord - radius, -y_coord - radius,
+                            x_coord + radius, -y_coord + radius)
+
+    def draw_tail(self) -> None:
+        """Move tail segment canvas items to their current positions."""
+        for segment, position in zip(self.segments, self._positions):
+            self._draw_segment(segment, position)
+
+    def move(self) -> bool:
+        """Update snake position.
+
+        Returns:
+            True if the snake moved, False if it is stopped.
+        """
         if self.head_direction is not Direction.STOP:
-            delta_x, delta_y = Snake._move_delta_map[self.head_direction]
-            previous_head_position = self.head.xcor(), self.head.ycor()
-            new_x = self.head.xcor() + delta_x
-            new_y = self.head.ycor() + delta_y
-            self.head.goto(new_x, new_y)
+            delta_x, delta_y = self._delta
+            x_coord, y_coord = self.head_position
+            self.head_position = Coords(x_coord + delta_x, y_coord + delta_y)
+            self.head.goto(self.head_position)
 
-            self.update_tail(previous_head_position)
+            self.update_tail((x_coord, y_coord))
+            return True
+        return False
 
-    def update_tail(self, prev_head_position: tuple[float, float]) -> None:
-        """Update positions of tail segments."""
-        prev_head_x, prev_head_y = prev_head_position
-        # Update tail segments in reverse order.
-        for current, previous in pairwise(reversed(self.segments)):
-            current.goto(previous.xcor(), previous.ycor())
+    def update_tail(self, prev_head_position: tuple[int, int]) -> None:
+        """Update positions of tail segments.
 
-        # Update first segment to old head position.
-        if self.segments:
-            self.segments[0].goto(prev_head_x, prev_head_y)
+        The segments are redrawn by draw_tail().
+        """
+        positions = self._positions
+        if not positions:
+            return
+        # Shift every segment one place towards the tail, with the
+        # first segment taking the old head position.
+        occupied = self._occupied
+        occupied[positions[0]] += 1
+        positions.appendleft(prev_head_position)
+        tail_position = positions.pop()
+        occupied[tail_position] -= 1
+        if not occupied[tail_position]:
+            del occupied[tail_position]
 
 
 class Food(turtle.Turtle):
     """Sprites to be collected."""
-    def __init__(self, config: Config, sprite_config: SpriteConfig) -> None:
+    # Random positions to try before accepting one that touches the snake.
+    _max_placement_attempts = 100
+
+    def __init__(self, config: Config,
+                 sprite_config: SpriteConfig,
+                 snake: Snake | None = None) -> None:
         """Initialise Food items.
 
         Each 'Food' instance is a Turtle with additional attributes
@@ -214,14 +327,19 @@ class Food(turtle.Turtle):
         Args:
             config: Default configuration settings.
             sprite_config: Sprite attributes.
+            snake: Snake that food should not be placed on.
         """
         super().__init__()
         self.config = config
         self.sprite_config = sprite_config
         self.sprite_size = sprite_config.sprite_size
+        self._snake = snake
+        self._food_attributes: SpriteAttributes | None = None
+        self._set_placement_limits()
         # Register food gifs
         self.register_gifs()
 
+        self.penup()
         attributes = choice(sprite_config.food_attributes)
         self.set_attributes(attributes)
         self.place_food()
@@ -236,32 +354,48 @@ class Food(turtle.Turtle):
                     turtle.register_shape(attr.shape)
 
     def set_attributes(self, food_attributes: SpriteAttributes) -> None:
-        """Set food turtle attributes."""
+        """Set food turtle attributes, if they have changed."""
+        if food_attributes == self._food_attributes:
+            return
+        self._food_attributes = food_attributes
         self.color(food_attributes.color)
-        self.value = food_attributes.value
         try:
             self.shape(food_attributes.shape)
         except turtle.TurtleGraphicsError as exc:
             print(f"{exc}")
-        self.penup()
 
-    def place_food(self) -> None:
-        """Add food item at random position."""
+    @property
+    def value(self) -> int:
+        """Return the score value of the current food item."""
+        return self._food_attributes.value
+
+    def _set_placement_limits(self) -> None:
+        """Calculate the area in which food may be placed."""
         padding = self.sprite_size
         x_max = self.config.display_width // 2 - padding
         half_height = self.config.display_height // 2
-        y_max = half_height - self.config.scoreboard_height - padding
-        y_min = padding - half_height
-        position = randint(-x_max, x_max), randint(y_min, y_max)
+        self._x_limits = -x_max, x_max
+        self._y_limits = (padding - half_height,
+                          half_height - self.config.scoreboard_height - padding)
+
+    def place_food(self) -> None:
+        """Add food item at random position clear of the snake."""
+        for _ in range(self._max_placement_attempts):
+            position = randint(*self._x_limits), randint(*self._y_limits)
+            if (self._snake is None
+                    or not self._snake.is_near(position, self.sprite_size)):
+                break
         self.goto(position)
 
     def replace_food(self):
-        """Re-initialise 'eaten' food as new food item."""
-        self.remove_food()
+        """Re-initialise 'eaten' food as new food item.
+
+        The tracer is off, so the sprite can be changed and moved in
+        place without hiding it first.
+        """
         attributes = choice(self.sprite_config.food_attributes)
         self.set_attributes(attributes)
         self.place_food()
-        self.showturtle()
 
     def remove_food(self):
         """Hides food sprite."""
@@ -8,16 +8,25 @@ scoreboard, and updating the score display.
 import turtle
 
 from snake.config import Config, SpriteConfig
-from snake.constants import TextAttributes
 from snake.game_state import GameState
 
 
-# Typehint alias
-Pen = turtle.Turtle
-
-
 class ScreenManager:
-    """Draw and manage screen areas."""
+    """Draw and manage screen areas.
+
+    Note:
+        Animation is turned off. setup_screen() does the one initial
+        flush. update_score(), score_splash() and _clear_splash() never
+        flush: they change plain canvas text items, which Tk repaints
+        by itself. Sprite turtles only appear on the game loop's redraw,
+        except while SnakeHead._spin_step() animates the head.
+    """
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = ('config', 'sprite_config', 'screen', '_canvas',
+                 '_half_height', '_score_vpos', '_score_font', '_score_item',
+                 '_last_scores', '_format_scores', '_splash_item',
+                 '_pending_splashes')
+
     def __init__(self, config: Config, sprite_config: SpriteConfig):
         """Initialise ScreenManager.
 
@@ -28,21 +37,27 @@ class ScreenManager:
         self.config = config
         self.sprite_config = sprite_config
         self.screen = turtle.Screen()
+        self._canvas = self.screen.getcanvas()
 
-        # Create Turtles for drawing and writing.
-        self.scoreboard_pen = turtle.Turtle()  # Writes scores at top.
-        # Writes eaten food score value. As this is never cleared, this
-        # pen only needs to have its attributes set once.
-        self.splash_pen = turtle.Turtle()
-        self.set_pen_attributes(self.splash_pen, self.config.splash_text)
+        # Layout values used by several draw methods.
+        self._half_height = config.display_height // 2
+        self._score_vpos = self._half_height - config.scoreboard_height
+        self._score_font = config.scoreboard_text.font
 
-        self.graphics_pen = turtle.Turtle()  # Draws board regions.
+        # Canvas text item for scores, created by setup_screen().
+        self._score_item: int | None = None
+        self._last_scores: tuple[int, int] | None = None
+        self._format_scores = "Score : {0}  High Score : {1}".format
+
+        # Canvas text item for eaten food values, created by setup_screen().
+        self._splash_item: int | None = None
+        self._pending_splashes = 0
 
         self.setup_screen()
 
     def setup_screen(self):
         """Setup screen properties and initialise the board."""
-        turtle.tracer(0)  # pylint: disable=no-member
+        self.screen.tracer(0, 0)
         width = self.config.display_width
         height = self.config.display_height
 
@@ -52,22 +67,20 @@ class ScreenManager:
         self.screen.title("Snake")
         self.screen.bgcolor(self.config.bg)
 
-        self.draw_scoreboard()
-        self.draw_game_area()
-
-    @staticmethod
-    def set_pen_attributes(pen: Pen, attributes: TextAttributes) -> None:
-        """Clear pen and set or reset pen attributes."""
-        pen.clear()
-        pen.hideturtle()
-        pen.penup()
-        pen.color(attributes.color)
+        # The board is static, so only create its canvas items once.
+        if self._score_item is None:
+            self.draw_scoreboard()
+            self.draw_game_area()
+            self._create_score_item()
+            self._create_splash_item()
+        # Paint the whole board in one flush.
+        self.screen.update()
 
     def draw_scoreboard(self) -> None:
         """Draw the score area at the top of the screen."""
         height = self.config.scoreboard_height
         width = self.config.display_width
-        top = self.config.display_height // 2
+        top = self._half_height
         color = self.config.scoreboard_text.bg_color
         self._draw_board_region(width, height, top, color)
 
@@ -76,7 +89,7 @@ class ScreenManager:
         scoreboard_height = self.config.scoreboard_height
         width = self.config.display_width
         height = self.config.display_height - scoreboard_height
-        top = self.config.display_height // 2 - scoreboard_height
+        top = self._score_vpos
         color = self.config.board_color
         self._draw_board_region(width, height, top, color)
 
@@ -84,42 +97,58 @@ class ScreenManager:
                            height: int,
                            top: int,
                            color: str) -> None:
-        """Draw rectangular area the width of the board."""
-        self.graphics_pen.hideturtle()
-        self.graphics_pen.penup()
-        # Start at top left corner.
-        self.graphics_pen.goto(-width // 2, top)
-        self.graphics_pen.pendown()
-        self.graphics_pen.color(color)
-
-        self.graphics_pen.begin_fill()
-        for distance in (width, height, width, height):
-            self.graphics_pen.forward(distance)
-            self.graphics_pen.right(90)
-        self.graphics_pen.end_fill()
+        """Draw rectangular area the width of the board.
 
-    def update_score(self, game_state: GameState) -> None:
-        """Write current score to screen."""
-        self.set_pen_attributes(self.scoreboard_pen,
-                                self.config.scoreboard_text)
+        Canvas y coordinates increase downwards, so are the negative
+        of turtle y coordinates.
+        """
+        left = -width // 2
+        self._canvas.create_rectangle(
+            left, -top, left + width, height - top,
+            fill=color, outline=color
+        )
 
-        vpos = ((self.config.display_height // 2)
-                - self.config.scoreboard_height)
-        self.scoreboard_pen.goto(0, vpos)
+    def _create_score_item(self) -> None:
+        """Create the canvas text item that displays the scores.
 
-        self.scoreboard_pen.write(
-            f"Score : {game_state.current_score}  "
-            f"High Score : {game_state.best_score}", align="center",
-            font=self.config.scoreboard_text.font
+        The text is anchored in the same way as Turtle.write() with
+        align="center", and its content is replaced by update_score().
+        """
+        self._score_item = self._canvas.create_text(
+            -1, -self._score_vpos, text='', anchor='s',
+            fill=self.config.scoreboard_text.color,
+            font=self._score_font
         )
 
-    def score_splash(self, value: int) -> None:
-        """Display last score for a few seconds.
+    def _create_splash_item(self) -> None:
+        """Create the canvas text item that displays eaten food values.
 
-        Note:
-            As we do not call clear() on this turtle, it is not
-            necessary to re-initialise attributes.
+        The text is anchored in the same way as Turtle.write() at the
+        origin with the default align="left".
         """
-        self.splash_pen.home()
-        self.splash_pen.write(f"{value:+}", font=self.config.scoreboard_text.font)
-        self.screen.ontimer(self.splash_pen.undo, 500)
+        self._splash_item = self._canvas.create_text(
+            -1, 0, text='', anchor='sw',
+            fill=self.config.splash_text.color,
+            font=self._score_font
+        )
+
+    def update_score(self, game_state: GameState) -> None:
+        """Write current score to screen."""
+        scores = (game_state.current_score, game_state.best_score)
+        if scores == self._last_scores:
+            return
+        self._last_scores = scores
+        self._canvas.itemconfigure(
+            self._score_item, text=self._format_scores(*scores))
+
+    def score_splash(self, value: int) -> None:
+        """Display last score for half a second."""
+        self._canvas.itemconfigure(self._splash_item, text=f"{value:+}")
+        self._pending_splashes += 1
+        self.screen.ontimer(self._clear_splash, 500)
+
+    def _clear_splash(self) -> None:
+        """Blank the splash text unless a newer splash is still showing."""
+        self._pending_splashes -= 1
+        if self._pending_splashes == 0:
+            self._canvas.itemconfigure(self._splash_item, text='')